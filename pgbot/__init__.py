@@ -32,6 +32,22 @@ async def _init():
     print("The PygameCommunityBot is now online!")
     print("Server(s):")
 
+    # map the IDs of the channels the bot needs to the names of the attributes
+    # of common they are stored in, so that every channel is looked up once
+    channel_attrs = {
+        common.ServerConstants.DB_CHANNEL_ID: "db_channel",
+        common.ServerConstants.LOG_CHANNEL_ID: "log_channel",
+        common.ServerConstants.ARRIVALS_CHANNEL_ID: "arrivals_channel",
+        common.ServerConstants.GUIDE_CHANNEL_ID: "guide_channel",
+        common.ServerConstants.ROLES_CHANNEL_ID: "roles_channel",
+        common.ServerConstants.ENTRIES_DISCUSSION_CHANNEL_ID: "entries_discussion_channel",
+        common.ServerConstants.CONSOLE_CHANNEL_ID: "console_channel",
+        common.ServerConstants.RULES_CHANNEL_ID: "rules_channel",
+    }
+    entry_channel_keys = {
+        value: key for key, value in common.ServerConstants.ENTRY_CHANNEL_IDS.items()
+    }
+
     for server in common.bot.guilds:
         prim = ""
 
@@ -46,26 +62,15 @@ async def _init():
             continue
 
         for channel in server.channels:
-            if channel.id == common.ServerConstants.DB_CHANNEL_ID:
-                common.db_channel = channel
-                await db.init()
-            elif channel.id == common.ServerConstants.LOG_CHANNEL_ID:
-                common.log_channel = channel
-            elif channel.id == common.ServerConstants.ARRIVALS_CHANNEL_ID:
-                common.arrivals_channel = channel
-            elif channel.id == common.ServerConstants.GUIDE_CHANNEL_ID:
-                common.guide_channel = channel
-            elif channel.id == common.ServerConstants.ROLES_CHANNEL_ID:
-                common.roles_channel = channel
-            elif channel.id == common.ServerConstants.ENTRIES_DISCUSSION_CHANNEL_ID:
-                common.entries_discussion_channel = channel
-            elif channel.id == common.ServerConstants.CONSOLE_CHANNEL_ID:
-                common.console_channel = channel
-            elif channel.id == common.ServerConstants.RULES_CHANNEL_ID:
-                common.rules_channel = channel
-            for key, value in common.ServerConstants.ENTRY_CHANNEL_IDS.items():
-                if channel.id == value:
-                    common.entry_channels[key] = channel
+            attr = channel_attrs.get(channel.id)
+            if attr is not None:
+                setattr(common, attr, channel)
+                if attr == "db_channel":
+                    await db.init()
+
+            key = entry_channel_keys.get(channel.id)
+            if key is not None:
+                common.entry_channels[key] = channel
 
 
 async def init():
@@ -100,10 +105,11 @@ def format_entries_message(msg: discord.Message, entry_type: str):
     else:
         title = ""
 
-    attachments = ""
     if msg.attachments:
-        for i, attachment in enumerate(msg.attachments):
-            attachments += f" • [Link {i + 1}]({attachment.url})\n"
+        attachments = "\n".join(
+            f" • [Link {i}]({attachment.url})"
+            for i, attachment in enumerate(msg.attachments, 1)
+        )
     else:
         attachments = "No attachments"
 
@@ -118,6 +124,39 @@ def format_entries_message(msg: discord.Message, entry_type: str):
     return title, fields
 
 
+def update_cmd_logs(invoke_msg_id: int, response_msg: discord.Message):
+    """
+    Store the response message of a command in the command logs, and drop the
+    oldest logs if there are too many of them
+    """
+    remove_cmd_log(invoke_msg_id)
+    common.cmd_logs[invoke_msg_id] = response_msg
+    common.cmd_logs_by_response[response_msg.id] = invoke_msg_id
+
+    while len(common.cmd_logs) > common.CMD_LOGS_LIMIT:
+        old_invoke_msg_id, old_response_msg = common.cmd_logs.popitem(last=False)
+        remove_cmd_log_response(old_invoke_msg_id, old_response_msg)
+
+
+def remove_cmd_log(invoke_msg_id: int):
+    """
+    Remove a command from the command logs, if it is there
+    """
+    response_msg = common.cmd_logs.pop(invoke_msg_id, None)
+    if response_msg is not None:
+        remove_cmd_log_response(invoke_msg_id, response_msg)
+
+
+def remove_cmd_log_response(invoke_msg_id: int, response_msg: discord.Message):
+    """
+    Remove the reverse lookup entry of a removed command log. Commands like
+    pg!refresh reuse the response message of another command, so the entry is
+    only removed if it belongs to the given command
+    """
+    if common.cmd_logs_by_response.get(response_msg.id) == invoke_msg_id:
+        del common.cmd_logs_by_response[response_msg.id]
+
+
 async def member_join(member: discord.Member):
     """
     This function handles the greet message when a new member joins
@@ -126,29 +165,37 @@ async def member_join(member: discord.Member):
         # Do not greet people in test mode, or if a bot joins
         return
 
-    greet = random.choice(common.BOT_WELCOME_MSG["greet"])
-    check = random.choice(common.BOT_WELCOME_MSG["check"])
-
-    grab = random.choice(common.BOT_WELCOME_MSG["grab"])
-    end = random.choice(common.BOT_WELCOME_MSG["end"])
-
     # This function is called right when a member joins, even before the member
     # finishes the join screening. So we wait for that to happen and then send
     # the message. Wait for a maximum of six hours.
-    for _ in range(10800):
-        await asyncio.sleep(2)
-
-        if not member.pending:
-            # Don't use embed here, because pings would not work
-            await common.arrivals_channel.send(
-                f"{greet} {member.mention}! {check} "
-                + f"{common.guide_channel.mention}{grab} "
-                + f"{common.roles_channel.mention}{end}"
+    if member.pending:
+        try:
+            await common.bot.wait_for(
+                "member_update",
+                check=lambda _, after: (
+                    after.id == member.id
+                    and after.guild.id == member.guild.id
+                    and not after.pending
+                ),
+                timeout=21600,
             )
-            # new member joined, yaayyy, snek is happi
-            await emotion.update("happy", 20)
+        except asyncio.TimeoutError:
             return
 
+    greet, check, grab, end = (
+        random.choice(common.BOT_WELCOME_MSG[key])
+        for key in ("greet", "check", "grab", "end")
+    )
+
+    # Don't use embed here, because pings would not work
+    await common.arrivals_channel.send(
+        f"{greet} {member.mention}! {check} "
+        f"{common.guide_channel.mention}{grab} "
+        f"{common.roles_channel.mention}{end}"
+    )
+    # new member joined, yaayyy, snek is happi
+    await emotion.update("happy", 20)
+
 
 async def clean_db_member(member: discord.Member):
     """
@@ -166,15 +213,14 @@ async def message_delete(msg: discord.Message):
     """
     This function is called for every message deleted by user.
     """
-    if msg.id in common.cmd_logs.keys():
-        del common.cmd_logs[msg.id]
+    if msg.id in common.cmd_logs:
+        remove_cmd_log(msg.id)
 
     elif msg.author.id == common.bot.user.id:
-        for log in common.cmd_logs.keys():
-            if common.cmd_logs[log].id is not None:
-                if common.cmd_logs[log].id == msg.id:
-                    del common.cmd_logs[log]
-                    return
+        invoke_msg_id = common.cmd_logs_by_response.get(msg.id)
+        if invoke_msg_id is not None:
+            remove_cmd_log(invoke_msg_id)
+            return
 
     if common.GENERIC or common.TEST_MODE:
         return
@@ -202,8 +248,10 @@ async def message_edit(old: discord.Message, new: discord.Message):
     """
     if new.content.startswith(common.PREFIX):
         try:
-            if new.id in common.cmd_logs.keys():
-                await commands.handle(new, common.cmd_logs[new.id])
+            if new.id in common.cmd_logs:
+                ret = await commands.handle(new, common.cmd_logs[new.id])
+                if ret is not None:
+                    update_cmd_logs(new.id, ret)
         except discord.HTTPException:
             pass
 
@@ -264,10 +312,7 @@ async def handle_message(msg: discord.Message):
     if msg.content.startswith(common.PREFIX):
         ret = await commands.handle(msg)
         if ret is not None:
-            common.cmd_logs[msg.id] = ret
-
-        if len(common.cmd_logs) > 100:
-            del common.cmd_logs[list(common.cmd_logs.keys())[0]]
+            update_cmd_logs(msg.id, ret)
 
         await emotion.update("bored", -10)
 
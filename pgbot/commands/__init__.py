@@ -135,4 +135,6 @@ async def handle(invoke_msg: discord.Message, response_msg: discord.Message = No
     )
     cmd.is_priv = is_priv
     await cmd.handle_cmd()
-    return response_msg
+
+    # the command could have replaced the response message with another one
+    return cmd.response_msg
@@ -390,13 +390,13 @@ class AdminCommand(UserCommand, SudoCommand, EmsudoCommand):
             else:
                 msg = (
                     f"From\n> `{start_date_str} | {start_date.isoformat()}`\n"
-                    + f"To\n> `{end_date_str} | {end_date.isoformat()}`"
+                    f"To\n> `{end_date_str} | {end_date.isoformat()}`"
                 )
 
             archive_header_msg_embed = embed_utils.create(
                 title=f"__Archive of `#{origin.name}`__",
                 description=f"\nAn archive of **{origin.mention}** "
-                f"({len(messages)} message(s))\n\n" + msg,
+                f"({len(messages)} message(s))\n\n{msg}",
                 color=0xFFFFFF,
                 footer_text="Status: Incomplete",
             )
@@ -414,6 +414,11 @@ class AdminCommand(UserCommand, SudoCommand, EmsudoCommand):
             for i, msg in enumerate(
                 reversed(messages) if not oldest_first else messages
             ):
+                # every message is sent over the network anyways, only give
+                # other tasks an explicit turn once in a while
+                if i and not i % 64:
+                    await asyncio.sleep(0)
+
                 if msg_count > 2 and not i % 2:
                     await embed_utils.edit_field_from_dict(
                         self.response_msg,
@@ -422,7 +427,7 @@ class AdminCommand(UserCommand, SudoCommand, EmsudoCommand):
                             name="Archiving Messages",
                             value=f"`{i}/{msg_count}` messages archived\n"
                             f"{(i / msg_count) * 100:.01f}% | "
-                            + utils.progress_bar(i / msg_count, divisions=30),
+                            f"{utils.progress_bar(i / msg_count, divisions=30)}",
                         ),
                         0,
                     )
@@ -484,22 +489,12 @@ class AdminCommand(UserCommand, SudoCommand, EmsudoCommand):
                             msg_embed = None
 
                         if len(msg.content) > 2000:
-                            start_idx = 0
-                            stop_idx = 0
-                            for i in range(len(msg.content) // 2000):
-                                start_idx = 2000 * i
-                                stop_idx = 2000 + 2000 * i
-
-                                if not i:
-                                    await destination.send(
-                                        content=msg.content[start_idx:stop_idx],
-                                        allowed_mentions=no_mentions,
-                                    )
-                                else:
-                                    await destination.send(
-                                        content=msg.content[start_idx:stop_idx],
-                                        allowed_mentions=no_mentions,
-                                    )
+                            stop_idx = len(msg.content) // 2000 * 2000
+                            for start_idx in range(0, stop_idx, 2000):
+                                await destination.send(
+                                    content=msg.content[start_idx : start_idx + 2000],
+                                    allowed_mentions=no_mentions,
+                                )
 
                             with io.StringIO(msg.content) as fobj:
                                 await destination.send(
@@ -629,8 +624,6 @@ class AdminCommand(UserCommand, SudoCommand, EmsudoCommand):
                         for embed_data_fobj in embed_data_fobjs:
                             embed_data_fobj.close()
 
-                await asyncio.sleep(0)
-
         if divider_str and not raw:
             await destination.send(content=divider_str)
 
@@ -647,7 +640,7 @@ class AdminCommand(UserCommand, SudoCommand, EmsudoCommand):
             dict(
                 name=f"Successfully archived {msg_count} message(s)",
                 value=f"`{msg_count}/{msg_count}` messages archived\n"
-                "100% | " + utils.progress_bar(1.0, divisions=30),
+                f"100% | {utils.progress_bar(1.0, divisions=30)}",
             ),
             0,
         )
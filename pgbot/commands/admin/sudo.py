@@ -604,6 +604,9 @@ class SudoCommand(BaseCommand):
             await destination.trigger_typing()
 
             escaped_msg_content = msg.content.replace("```", "\\`\\`\\`")
+            # escaping only makes the content longer, so this also covers the
+            # length of the unescaped content
+            is_long_content = len(escaped_msg_content) > 2000
             attached_files = None
             if attachments:
                 with io.StringIO("This file was too large to be duplicated.") as fobj:
@@ -621,16 +624,11 @@ class SudoCommand(BaseCommand):
                 info_embed.set_author(name="Message data & info")
                 info_embed.title = ""
 
-                info_embed.description = "".join(
-                    (
-                        f"__Text"
-                        + (" (Shortened)" if len(escaped_msg_content) > 2000 else "")
-                        + "__:",
-                        f"\n\n ```\n{escaped_msg_content[:2001]}\n\n[...]\n```"
-                        + "\n\u2800"
-                        if len(escaped_msg_content) > 2000
-                        else "\n\u2800",
-                    )
+                info_embed.description = (
+                    "__Text (Shortened)__:\n\n "
+                    f"```\n{escaped_msg_content[:2001]}\n\n[...]\n```\n\u2800"
+                    if is_long_content
+                    else "__Text__:\n\u2800"
                 )
 
                 content_file = None
@@ -650,7 +648,7 @@ class SudoCommand(BaseCommand):
                         ),
                     )
             else:
-                if len(msg.content) > 2000 or len(escaped_msg_content) > 2000:
+                if is_long_content:
                     with io.StringIO(msg.content) as fobj:
                         await destination.send(
                             file=discord.File(fobj, "messagedata.txt"),
@@ -14,6 +14,7 @@ import asyncio
 import datetime
 import inspect
 import random
+import re
 from typing import Any, Generator, Optional, Union
 
 import discord
@@ -35,6 +36,10 @@ ESCAPES = {
     "'": "'",
 }
 
+# regex for escape sequences in strings, the group is the escape sequence
+# without the backslash, which includes the hex code of unicode escapes
+ESCAPE_SEQUENCE_REGEX = re.compile(r"\\([xX].{0,2}|u.{0,4}|U.{0,8}|.)", re.DOTALL)
+
 
 class BotException(Exception):
     """
@@ -74,15 +79,13 @@ class CodeBlock:
 
         elif code.startswith(md_bacticks) or code.endswith(md_bacticks):
             code = code.strip("`")
-            if code[0].isspace():
+            if code[:1].isspace():
                 code = code[1:]
-            elif code[0].isalnum():
-                i = 0
-                for i in range(len(code)):
-                    if code[i].isspace():
-                        break
-                self.lang = code[:i]
-                code = code[i + 1 :]
+            elif code[:1].isalnum():
+                # the language name is everything upto the first whitespace
+                splits = code.split(maxsplit=1)
+                self.lang = splits[0]
+                code = splits[1] if len(splits) == 2 else ""
 
         self.code: str = code.strip().strip("\\")  # because \\ causes problems
 
@@ -100,42 +103,32 @@ class String:
         """
         Convert a "raw" string to one where characters are escaped
         """
-        cnt = 0
-        newstr = ""
-        while cnt < len(string):
-            char = string[cnt]
-            cnt += 1
-            if char == "\\":
-                # got a backslash, handle escapes
-                char = string[cnt]
-                cnt += 1
-                if char.lower() in ["x", "u"]:  # these are unicode escapes
-                    if char.lower() == "x":
-                        n = 2
-                    else:
-                        n = 4 if char == "u" else 8
+        return ESCAPE_SEQUENCE_REGEX.sub(self.escape_sequence, string)
 
-                    var = string[cnt : cnt + n]
-                    cnt += n
-                    try:
-                        newstr += chr(int(var, base=16))
-                    except ValueError:
-                        raise BotException(
-                            "Invalid escape character",
-                            "Invalid unicode escape character in string",
-                        )
-                elif char in ESCAPES:
-                    # general escapes
-                    newstr += ESCAPES[char]
-                else:
-                    raise BotException(
-                        "Invalid escape character",
-                        "Invalid unicode escape character in string",
-                    )
-            else:
-                newstr += char
+    @staticmethod
+    def escape_sequence(match: re.Match):
+        """
+        Get the escaped character for an escape sequence matched by
+        ESCAPE_SEQUENCE_REGEX
+        """
+        char = match[1][0]
+        if char in "xXuU":  # these are unicode escapes
+            try:
+                return chr(int(match[1][1:], base=16))
+            except (ValueError, OverflowError):
+                raise BotException(
+                    "Invalid escape character",
+                    "Invalid unicode escape character in string",
+                )
+
+        if char in ESCAPES:
+            # general escapes
+            return ESCAPES[char]
 
-        return newstr
+        raise BotException(
+            "Invalid escape character",
+            "Invalid unicode escape character in string",
+        )
 
 
 SPLIT_FLAGS = [
@@ -331,25 +324,64 @@ class BaseCommand:
             common.BASIC_MAX_FILE_SIZE if self.is_dm else self.guild.filesize_limit
         )
 
-        # build self.groups and self.cmds_and_functions from class functions
-        self.cmds_and_funcs = {}  # this is a mapping from funtion name to funtion
-        self.groups = {}  # This is a mapping from group name to list of sub functions
-        for attr in dir(self):
-            if attr.startswith(common.CMD_FUNC_PREFIX):
-                func = self.__getattribute__(attr)
-                name = attr[len(common.CMD_FUNC_PREFIX) :]
-                self.cmds_and_funcs[name] = func
-
-                if hasattr(func, "groupname"):
-                    if func.groupname in self.groups:
-                        self.groups[func.groupname].append(func)
-                    else:
-                        self.groups[func.groupname] = [func]
+        # build self.groups and self.cmds_and_functions from the dispatch table
+        # of the class, bind the handler functions to this instance
+        cmd_table, group_table = self.get_dispatch_table()
+
+        # this is a mapping from funtion name to funtion
+        self.cmds_and_funcs = {
+            name: getattr(self, attr) for name, attr in cmd_table.items()
+        }
+
+        # This is a mapping from group name to list of sub functions
+        self.groups = {
+            groupname: [self.cmds_and_funcs[name] for name in names]
+            for groupname, names in group_table.items()
+        }
 
         # page number, useful for PagedEmbed commands. 0 by deafult, gets modified
         # in pg!refresh command when invoked
         self.page: int = 0
 
+    @classmethod
+    def get_dispatch_table(cls):
+        """
+        Get a tuple of two dicts, the first one maps command names to the names
+        of the handler functions, and the second one maps group names to a list
+        of command names of the sub commands. The sub commands are sorted in
+        descending order of the number of sub command names, so that the first
+        match is the correct one. This is computed only once per class, and is
+        cached on the class.
+        """
+        # do not use getattr here, because subclasses must not reuse the
+        # table of the parent class
+        if "_dispatch_table" in cls.__dict__:
+            return cls._dispatch_table
+
+        cmd_table: dict[str, str] = {}
+        group_table: dict[str, list[str]] = {}
+        for attr in dir(cls):
+            if not attr.startswith(common.CMD_FUNC_PREFIX):
+                continue
+
+            name = attr[len(common.CMD_FUNC_PREFIX) :]
+            cmd_table[name] = attr
+
+            func = getattr(cls, attr)
+            if hasattr(func, "groupname"):
+                if func.groupname in group_table:
+                    group_table[func.groupname].append(name)
+                else:
+                    group_table[func.groupname] = [name]
+
+        for names in group_table.values():
+            names.sort(
+                key=lambda x: len(getattr(cls, cmd_table[x]).subcmds), reverse=True
+            )
+
+        cls._dispatch_table = (cmd_table, group_table)
+        return cls._dispatch_table
+
     def split_args(
         self, split_str: str, split_flags: list[tuple[str, Any, tuple]]
     ) -> Generator[Union[str, String, CodeBlock], None, None]:
@@ -787,11 +819,9 @@ class BaseCommand:
         is_group = False
         func = None
         if cmd in self.groups:
-            # iterate over group commands sorted in descending order, so that
+            # group commands are already sorted in descending order, so that
             # we find the correct match
-            for func in sorted(
-                self.groups[cmd], key=lambda x: len(x.subcmds), reverse=True
-            ):
+            for func in self.groups[cmd]:
                 n = len(func.subcmds)
                 if func.subcmds == tuple(args[:n]):
                     args = args[n:]
@@ -11,9 +11,7 @@ from __future__ import annotations
 import copy
 import datetime
 import io
-import os
 import re
-import time
 from typing import Optional, Union
 
 import discord
@@ -289,11 +287,7 @@ class UserCommand(FunCommand, HelpCommand):
         Implement pg!exec, for execution of python code
         """
         async with self.channel.typing():
-            tstamp = time.perf_counter_ns()
-
-            returned = await sandbox.exec_sandbox(
-                code.code, tstamp, 10 if self.is_priv else 5
-            )
+            returned = await sandbox.exec_sandbox(code.code, 10 if self.is_priv else 5)
             dur = returned.duration  # the execution time of the script alone
             embed_dict = {
                 "description": "",
@@ -315,20 +309,20 @@ class UserCommand(FunCommand, HelpCommand):
 
             if returned.img:
                 embed_dict["description"] += "\n**Image output:**"
-                if os.path.getsize(f"temp{tstamp}.png") < 2 ** 22:
-                    embed_dict["image_url"] = f"attachment://temp{tstamp}.png"
-                    file = discord.File(f"temp{tstamp}.png")
+                if len(returned.img) < 2 ** 22:
+                    embed_dict["image_url"] = "attachment://output.png"
+                    file = discord.File(io.BytesIO(returned.img), "output.png")
                 else:
                     embed_dict["description"] += (
-                        "\n```\nGIF could not be sent.\n"
-                        "The GIF file size is above 4MiB```"
+                        "\n```\nImage could not be sent.\n"
+                        "The image file size is above 4MiB```"
                     )
 
             elif returned._imgs:
                 embed_dict["description"] += "\n**GIF output:**"
-                if os.path.getsize(f"temp{tstamp}.gif") < 2 ** 22:
-                    embed_dict["image_url"] = f"attachment://temp{tstamp}.gif"
-                    file = discord.File(f"temp{tstamp}.gif")
+                if len(returned._imgs) < 2 ** 22:
+                    embed_dict["image_url"] = "attachment://output.gif"
+                    file = discord.File(io.BytesIO(returned._imgs), "output.gif")
                 else:
                     embed_dict["description"] += (
                         "\n```GIF could not be sent.\n"
@@ -355,10 +349,6 @@ class UserCommand(FunCommand, HelpCommand):
         if file:
             file.close()
 
-        for extension in ("gif", "png"):
-            if os.path.isfile(f"temp{tstamp}.{extension}"):
-                os.remove(f"temp{tstamp}.{extension}")
-
     @no_dm
     async def cmd_refresh(self, msg: discord.Message):
         """
@@ -8,7 +8,8 @@ This file defines the command handler class for the "help" commands of the bot
 
 from __future__ import annotations
 
-import os
+import asyncio
+import io
 import re
 import time
 from typing import Optional
@@ -182,19 +183,23 @@ class HelpCommand(BaseCommand):
         if self.guild is None:
             return
 
-        pygame.image.save(
-            await clock.user_clock(t, timezones, self.guild), f"temp{t}.png"
-        )
-        common.cmd_logs[self.invoke_msg.id] = await self.channel.send(
-            file=discord.File(f"temp{t}.png")
-        )
-        os.remove(f"temp{t}.png")
+        surf = await clock.user_clock(t, timezones, self.guild)
+        with io.BytesIO() as fobj:
+            # PNG encoding is CPU bound, don't block the event loop with it
+            await asyncio.to_thread(pygame.image.save, surf, fobj, "PNG")
+            fobj.seek(0)
+            clock_msg = await self.channel.send(
+                file=discord.File(fobj, filename="clock.png")
+            )
 
         try:
             await self.response_msg.delete()
         except discord.NotFound:
             pass
 
+        # the clock image is the response to the command from now on
+        self.response_msg = clock_msg
+
     @no_dm
     async def cmd_doc(self, name: str):
         """
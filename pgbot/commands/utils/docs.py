@@ -10,7 +10,9 @@ import asyncio
 import builtins
 import cmath
 import collections
+import functools
 import gc
+import importlib
 import itertools
 import json
 import math
@@ -63,20 +65,52 @@ doc_module_tuple = (
     time,
     timeit,
 )
-doc_module_dict = {}
-
-for module_obj in doc_module_tuple:
-    doc_module_dict[module_obj.__name__] = module_obj
+doc_module_dict = {module_obj.__name__: module_obj for module_obj in doc_module_tuple}
+
+# types of the members listed by the doc command, grouped by the heading they
+# are listed under. builtin functions and builtin methods share the same type
+doc_member_types = (
+    ("Modules", types.ModuleType),
+    ("Types", type),
+    ("Functions", (types.FunctionType, types.BuiltinFunctionType)),
+    ("Methods", types.MethodDescriptorType),
+)
 
-for module in sys.modules:
-    doc_module_dict[module] = sys.modules[module]
+# names of the top level modules of installed distributions. These modules are
+# not imported here, but only when their docs are requested for the first time
+installed_module_names = frozenset(
+    dist.project_name.replace("-", "_")
+    for dist in pkg_resources.working_set  # pylint: disable=not-an-iterable
+)
 
 
-for module in pkg_resources.working_set:  # pylint: disable=not-an-iterable
+@functools.lru_cache(maxsize=None)
+def import_installed_module(name: str):
+    """
+    Import the module of an installed distribution. Returns None if the module
+    could not be imported
+    """
     try:
-        doc_module_dict[module] = __import__(module.project_name.replace("-", "_"))
+        return importlib.import_module(name)
     except BaseException:
-        pass
+        return None
+
+
+def get_doc_module(name: str):
+    """
+    Get a module object from a module name, for the doc command. Returns None if
+    there is no such module
+    """
+    if name in doc_module_dict:
+        return doc_module_dict[name]
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    if name in installed_module_names:
+        return import_installed_module(name)
+
+    return None
 
 
 async def put_main_doc(name: str, original_msg: discord.Message):
@@ -90,27 +124,18 @@ async def put_main_doc(name: str, original_msg: discord.Message):
     except AttributeError:
         is_builtin = False
 
-    if splits[0] not in doc_module_dict and not is_builtin:
+    module = get_doc_module(splits[0])
+    if module is None and not is_builtin:
         await embed_utils.replace(
             original_msg, "Unknown module!", "No such module was found."
         )
         return None, None
 
-    module_objs = dict(doc_module_dict)
-    obj = None
-
-    for part in splits:
+    obj = getattr(builtins, splits[0]) if is_builtin else module
+    for part in splits[1:]:
         try:
-            try:
-                obj = getattr(builtins, part)
-            except AttributeError:
-                obj = module_objs[part]
-
-            module_objs = {}
-            for i in dir(obj):
-                if i != "__abstractmethods__":
-                    module_objs[i] = getattr(obj, i)
-        except KeyError:
+            obj = getattr(obj, part)
+        except AttributeError:
             await embed_utils.replace(
                 original_msg,
                 "Class/function/sub-module not found!",
@@ -131,9 +156,7 @@ async def put_main_doc(name: str, original_msg: discord.Message):
     if splits[0] == "pygame":
         doclink = "https://www.pygame.org/docs"
         if len(splits) > 1:
-            doclink += "/ref/" + splits[1].lower() + ".html"
-            doclink += "#"
-            doclink += "".join([s + "." for s in splits])[:-1]
+            doclink += f"/ref/{splits[1].lower()}.html#{name}"
         header = "Online documentation: " + doclink + "\n"
 
     docs = "" if obj.__doc__ is None else obj.__doc__
@@ -183,6 +206,16 @@ async def put_main_doc(name: str, original_msg: discord.Message):
         )
         return None, None
 
+    # only the members of the final object are listed, skip dunder members as
+    # those are not displayed anyways
+    module_objs = {}
+    for i in dir(obj):
+        if not i.startswith("__"):
+            try:
+                module_objs[i] = getattr(obj, i)
+            except AttributeError:
+                pass
+
     return module_objs, embeds
 
 
@@ -196,35 +229,13 @@ async def put_doc(
     if module_objs is None or main_embeds is None:
         return
 
-    allowed_obj_names = {
-        "Modules": [],
-        "Types": [],
-        "Functions": [],
-        "Methods": [],
-    }
-
-    formatted_obj_names = {
-        "module": "Modules",
-        "type": "Types",
-        "function": "Functions",
-        "method_descriptor": "Methods",
-    }
+    allowed_obj_names = {otype: [] for otype, _ in doc_member_types}
 
     for oname, modmember in module_objs.items():
-        if type(modmember).__name__ == "builtin_function_or_method":
-            # Disambiguate into funtion or method
-            obj_type_name = None
-            if isinstance(modmember, types.BuiltinFunctionType):
-                obj_type_name = "Functions"
-            elif isinstance(modmember, types.BuiltinMethodType):
-                obj_type_name = "Methods"
-        else:
-            obj_type_name = formatted_obj_names.get(type(modmember).__name__)
-
-        if oname.startswith("__") or obj_type_name is None:
-            continue
-
-        allowed_obj_names[obj_type_name].append(oname)
+        for otype, type_objs in doc_member_types:
+            if isinstance(modmember, type_objs):
+                allowed_obj_names[otype].append(oname)
+                break
 
     embeds = []
 
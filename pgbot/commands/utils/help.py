@@ -17,18 +17,19 @@ from pgbot import common
 from pgbot.utils import embed_utils
 
 
-# regex for doc string
-regex = re.compile(
-    # If you add a new "section" to this regex dont forget the "|" at the end
-    # Does not have to be in the same order in the docs as in here.
-    r"(->type|"
-    r"->signature|"
-    r"->description|"
-    r"->example command|"
-    r"->extended description\n|"
-    r"\Z)|(((?!->).|\n)*)"
+# names of the sections of a doc string, each section starts with a line
+# beginning with "->" followed by the name of the section
+doc_sections = (
+    "type",
+    "signature",
+    "description",
+    "example command",
+    "extended description",
 )
 
+# regex for runs of spaces in doc string values, like the indentation of lines
+multi_space_regex = re.compile("  +")
+
 
 def get_doc_from_func(func: typing.Callable):
     """
@@ -50,22 +51,30 @@ def get_doc_from_func(func: typing.Callable):
     if string.startswith("->skip"):
         return {}
 
-    finds = regex.findall(string.split("-----")[0])
-    current_key = ""
     data = {}
-    if finds:
-        for find in finds:
-            if find[0].startswith("->"):
-                current_key = find[0][2:].strip()
-                continue
+    current_key = None
+    lines = []
+    for line in string.split("-----", 1)[0].split("\n"):
+        stripped = line.lstrip()
+        if not stripped.startswith("->"):
+            lines.append(line)
+            continue
+
+        if current_key is not None:
+            # remove useless whitespace
+            data[current_key] = multi_space_regex.sub("", "\n".join(lines).strip())
 
-            if not current_key:
-                continue
+        # lines starting with "->" that do not start a known section end the
+        # previous section, but are not a part of the docs themselves
+        current_key = None
+        for section in doc_sections:
+            if stripped.startswith(section, 2):
+                current_key = section
+                lines = [stripped[len(section) + 2 :]]
+                break
 
-            # remove useless whitespace
-            value = re.sub("  +", "", find[1].strip())
-            data[current_key] = value
-            current_key = ""
+    if current_key is not None:
+        data[current_key] = multi_space_regex.sub("", "\n".join(lines).strip())
 
     return data
 
@@ -92,37 +101,19 @@ async def send_help_message(
         page: The page of the embed, 0 by default
     """
 
-    doc_fields = {}
     embeds = []
 
     if not commands:
-        functions = {}
-        for key, func in cmds_and_funcs.items():
-            if hasattr(func, "groupname"):
-                key = f"{func.groupname} {' '.join(func.subcmds)}"
-            functions[key] = func
-
-        for func in functions.values():
+        # command signatures and descriptions, grouped by the command type
+        doc_fields: dict[str, tuple[list[str], list[str]]] = {}
+        for func in cmds_and_funcs.values():
             data = get_doc_from_func(func)
             if not data:
                 continue
 
-            if not doc_fields.get(data["type"]):
-                doc_fields[data["type"]] = ["", "", True]
-
-            doc_fields[data["type"]][0] += f"{data['signature'][2:]}\n"
-            doc_fields[data["type"]][1] += (
-                f"`{data['signature']}`\n" f"{data['description']}\n\n"
-            )
-
-        doc_fields_cpy = doc_fields.copy()
-
-        for doc_field_name in doc_fields:
-            doc_field_list = doc_fields[doc_field_name]
-            doc_field_list[1] = f"```\n{doc_field_list[0]}\n```\n\n{doc_field_list[1]}"
-            doc_field_list[0] = f"__**{doc_field_name}**__"
-
-        doc_fields = doc_fields_cpy
+            signatures, descriptions = doc_fields.setdefault(data["type"], ([], []))
+            signatures.append(f"{data['signature'][2:]}\n")
+            descriptions.append(f"`{data['signature']}`\n{data['description']}\n\n")
 
         embeds.append(
             discord.Embed(
@@ -131,8 +122,11 @@ async def send_help_message(
                 color=common.BOT_HELP_PROMPT["color"],
             )
         )
-        for doc_field in list(doc_fields.values()):
-            body = f"{doc_field[0]}\n\n{doc_field[1]}"
+        for doc_type, (signatures, descriptions) in doc_fields.items():
+            body = (
+                f"__**{doc_type}**__\n\n"
+                f"```\n{''.join(signatures)}\n```\n\n{''.join(descriptions)}"
+            )
             embeds.append(
                 embed_utils.create(
                     title=common.BOT_HELP_PROMPT["title"],
@@ -143,8 +137,9 @@ async def send_help_message(
 
     elif commands[0] in cmds_and_funcs:
         func_name = commands[0]
-        funcs = groups[func_name] if func_name in groups else []
-        funcs.insert(0, cmds_and_funcs[func_name])
+        # do not modify the list in groups, the command handler dispatches
+        # group commands with it
+        funcs = [cmds_and_funcs[func_name], *groups.get(func_name, ())]
 
         for func in funcs:
             if (
@@ -10,9 +10,11 @@ This file defines exec sandbox utitites, for sandboxing and running user code.
 import asyncio
 import builtins
 import cmath
+import io
 import itertools
 import math
 import multiprocessing
+import queue
 import random
 import re
 import string
@@ -85,7 +87,7 @@ class Output:
         self._imgs.append(image.copy())
         self._delays.append(delay)
 
-    def _get_kwargs(self, tstamp, images):
+    def _get_kwargs(self, fp, images):
         if len(self._delays) != len(self._imgs):
             return "Length of delays must be the same as the length of imgs"
 
@@ -97,7 +99,7 @@ class Output:
             return "Please set the loops to an integer value."
 
         kwargs = {
-            "fp": f"temp{tstamp}.gif",
+            "fp": fp,
             "format": "GIF",
             "append_images": images[1:],
             "save_all": True,
@@ -227,7 +229,7 @@ for const in pygame.constants.__all__:
     setattr(FilteredPygame, const, pygame.constants.__dict__[const])
 
 
-def pg_exec(code: str, tstamp: int, allowed_builtins: dict, q: multiprocessing.Queue):
+def pg_exec(code: str, allowed_builtins: dict, q: multiprocessing.Queue):
     """
     exec wrapper used for pg!exec, runs in a seperate process. Since this
     function runs in a seperate Process, keep that in mind if you want to make
@@ -297,42 +299,37 @@ def pg_exec(code: str, tstamp: int, allowed_builtins: dict, q: multiprocessing.Q
         sanitized_output.exc = output.exc
 
     if isinstance(getattr(output, "img", None), pygame.Surface):
-        # A surface is not picklable, so handle differently
-        sanitized_output.img = True
-        pygame.image.save(output.img, f"temp{tstamp}.png")
+        # A surface is not picklable, so send the encoded PNG data instead
+        with io.BytesIO() as fobj:
+            pygame.image.save(output.img, fobj, "PNG")
+            sanitized_output.img = fobj.getvalue()
 
     if getattr(output, "_imgs", None):
-        i = 0
         images = []
         if isinstance(output._imgs, list):
             for surf in output._imgs:
                 if not isinstance(surf, pygame.Surface):
                     continue
-                if i == 0:
-                    pygame.image.save(surf, f"temp{tstamp}.png")
 
                 image = Image.frombytes(
                     "RGBA", surf.get_size(), pygame.image.tostring(surf, "RGBA")
                 )
                 images.append(image)
 
-                i += 1
-
-            if i > 0:
-                img = Image.open(f"temp{tstamp}.png")
-                kwargs = output._get_kwargs(tstamp, images)
-                if isinstance(kwargs, str):
-                    sanitized_output.exc = kwargs
-                else:
-                    img.save(**kwargs)
-                    sanitized_output._imgs = True
+            if images:
+                with io.BytesIO() as fobj:
+                    kwargs = output._get_kwargs(fobj, images)
+                    if isinstance(kwargs, str):
+                        sanitized_output.exc = kwargs
+                    else:
+                        # the encoded GIF data is sent instead of the surfaces
+                        images[0].save(**kwargs)
+                        sanitized_output._imgs = fobj.getvalue()
 
     q.put(sanitized_output)
 
 
-async def exec_sandbox(
-    code: str, tstamp: int, timeout: int = 5, max_memory: int = 2 ** 28
-):
+async def exec_sandbox(code: str, timeout: int = 5, max_memory: int = 2 ** 28):
     """
     Helper to run pg!exec code in a sandbox, manages the seperate process that
     runs to execute user code.
@@ -340,7 +337,7 @@ async def exec_sandbox(
     q = multiprocessing.Queue(1)
     proc = multiprocessing.Process(
         target=pg_exec,
-        args=(code, tstamp, filtered_builtins, q),
+        args=(code, filtered_builtins, q),
         daemon=True,  # the process must die when the main process dies
     )
     proc.start()
@@ -348,7 +345,18 @@ async def exec_sandbox(
 
     # is system-wide and has the highest resolution.
     start = time.perf_counter()
-    while proc.is_alive():
+    while True:
+        # read the output while the process is running. The output can hold
+        # encoded images, and the process cannot exit before all the data it
+        # put on the queue has been read from the underlying pipe
+        try:
+            return q.get_nowait()
+        except queue.Empty:
+            pass
+
+        if not proc.is_alive():
+            break
+
         if start + timeout < time.perf_counter():
             proc.kill()
             output = Output()
@@ -6,6 +6,7 @@ Copyright (c) 2020-present PygameCommunityDiscord
 This file defines some constants and variables used across the whole codebase
 """
 
+import collections
 import io
 import os
 from typing import Optional, Union
@@ -27,7 +28,11 @@ ints.members = True  # needed for on_member_join
 bot = discord.Client(intents=ints)
 window = pygame.Surface((1, 1))  # This will later be redefined
 
-cmd_logs = {}
+# mapping of the IDs of command messages to the response messages of the bot,
+# in the order they were last updated, and a mapping of the IDs of those
+# response messages back to the IDs of the command messages
+cmd_logs: collections.OrderedDict[int, discord.Message] = collections.OrderedDict()
+cmd_logs_by_response: dict[int, int] = {}
 
 # pygame community guild, or whichever is the 'primary' guild for the bot
 guild: Optional[discord.Guild] = None
@@ -79,6 +84,9 @@ ZERO_SPACE = "\u200b"  # U+200B
 
 DOC_EMBED_LIMIT = 3
 
+# maximum number of commands remembered in cmd_logs
+CMD_LOGS_LIMIT = 100
+
 # indicates whether the bot is in generic mode or not. Generic mode is useful
 # when you are testing the bot on other servers. Generic mode limits features of
 # the bot that requires access to server specific stuff
@@ -225,22 +233,24 @@ ILLEGAL_ATTRIBUTES = (
     "__dict__",
 )
 
-DEAD_CHAT_TRIGGERS = {
-    "the chat is dead",
-    "the chat is ded",
-    "this chat is dead",
-    "this is a ded chat",
-    "this is a dead chat",
-    "chat dead",
-    "chat ded",
-    "chatded",
-    "chatdead",
-    "dead chat",
-    "ded chat",
-    "dedchat",
-    "this chat ded",
-    "this chat dead",
-}
+DEAD_CHAT_TRIGGERS = frozenset(
+    {
+        "the chat is dead",
+        "the chat is ded",
+        "this chat is dead",
+        "this is a ded chat",
+        "this is a dead chat",
+        "chat dead",
+        "chat ded",
+        "chatded",
+        "chatdead",
+        "dead chat",
+        "ded chat",
+        "dedchat",
+        "this chat ded",
+        "this chat dead",
+    }
+)
 
 BOT_MENTION = "the bot" if GENERIC else f"<@!{ServerConstants.BOT_ID}>"
 
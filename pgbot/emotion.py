@@ -84,13 +84,17 @@ async def dad_joke(msg: discord.Message, mode: str = "happy"):
     """
     Utility to handle the bot making dad jokes
     """
+    lowered = unidecode.unidecode(msg.content.lower().strip())
+    if len(lowered) >= 60:
+        # too long to be a dad joke candidate, do not bother with the DB
+        return
+
     async with db.DiscordDB("feature") as db_obj:
         db_dict: dict[str, dict[int, bool]] = db_obj.get({})
         dadjokes = db_dict.get("dadjokes", {})
         if dadjokes.get(msg.channel.id, False):
             return
 
-    lowered = unidecode.unidecode(msg.content.lower().strip())
     for trigger in ("i am", "i'm"):
         if lowered == trigger:
             if mode == "happy":
@@ -101,8 +105,8 @@ async def dad_joke(msg: discord.Message, mode: str = "happy"):
                 )
             return
 
-        if trigger in lowered and len(lowered) < 60:
-            ind = lowered.index(trigger)
+        ind = lowered.find(trigger)
+        if ind != -1:
             if ind and not msg.content[ind - 1].isspace():
                 return
 
@@ -10,7 +10,6 @@ It gets called every 5 seconds or so.
 import asyncio
 import datetime
 import io
-import os
 import random
 import sys
 
@@ -91,9 +90,7 @@ async def handle_console():
     sys.stdout = sys.stderr = common.stdout = io.StringIO()
 
     # hide path data
-    contents = contents.replace(os.getcwd(), "PgBot")
-    if os.name == "nt":
-        contents = contents.replace(os.path.dirname(sys.executable), "Python")
+    contents = utils.hide_paths(contents)
 
     if common.GENERIC or common.console_channel is None:
         # just print error to shell if we cannot sent it on discord
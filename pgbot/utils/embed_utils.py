@@ -138,6 +138,9 @@ EMBED_ATTRIBUTES_WITH_SUB_ATTRIBUTES_SET = {
 
 DEFAULT_EMBED_COLOR = 0xFFFFAA
 
+# translation table to escape markdown characters in member names
+MARKDOWN_ESCAPE_TABLE = str.maketrans({"\\": r"\\", "*": r"\*", "`": r"\`", "_": r"\_"})
+
 CONDENSED_EMBED_DATA_LIST_SYNTAX = """
 # Condensed embed data list syntax. String elements that are empty "" will be ignored.
 # The list must contain at least one argument.
@@ -657,8 +660,12 @@ class PagedEmbed:
 
             page.set_footer(text=footer)
 
-        await self.message.edit(embed=self.pages[self.current_page])
-        await self.add_control_emojis()
+        # editing the message and adding the reactions are independent requests,
+        # only the reactions themselves have to be added in order
+        await asyncio.gather(
+            self.message.edit(embed=self.pages[self.current_page]),
+            self.add_control_emojis(),
+        )
 
         return True
 
@@ -1854,12 +1861,7 @@ def get_member_info_str(member: Union[discord.Member, discord.User]):
 
     member_name_info = f"\u200b\n*Name*: \n> {member.mention} \n> "
     if hasattr(member, "nick") and member.display_name:
-        member_nick = (
-            member.display_name.replace("\\", r"\\")
-            .replace("*", r"\*")
-            .replace("`", r"\`")
-            .replace("_", r"\_")
-        )
+        member_nick = member.display_name.translate(MARKDOWN_ESCAPE_TABLE)
         member_name_info += (
             f"**{member_nick}**\n> (*{member.name}#{member.discriminator}*)\n\n"
         )
@@ -2013,12 +2015,7 @@ def get_msg_info_embed(msg: discord.Message, author: bool = True):
     member_name_info = f"\u200b\n*Name*: \n> {member.mention} \n> "
 
     if isinstance(member, discord.Member) and member.nick:
-        member_nick = (
-            member.nick.replace("\\", r"\\")
-            .replace("*", r"\*")
-            .replace("`", r"\`")
-            .replace("_", r"\_")
-        )
+        member_nick = member.nick.translate(MARKDOWN_ESCAPE_TABLE)
         member_name_info += (
             f"**{member_nick}**\n> (*{member.name}#{member.discriminator}*)\n\n"
         )
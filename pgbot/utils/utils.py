@@ -10,35 +10,72 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import functools
+import operator
 import os
 import platform
+import re
 import sys
 import traceback
-from typing import Callable, Iterable, Union
+from typing import Callable, Iterable, Optional, Union
 
 import discord
 import pygame
 
 from pgbot import common
 
+# getter for the permissions checked by default in check_channel_permissions
+DEFAULT_PERMISSIONS_GETTER = operator.attrgetter("view_channel", "send_messages")
+
+# paths that are hidden from console output and formatted exceptions, mapped to
+# the names they are replaced with. The path to python is only hidden on windows
+HIDDEN_PATHS = {os.getcwd(): "PgBot"}
+if platform.system() == "Windows":
+    HIDDEN_PATHS[os.path.dirname(sys.executable)] = "Python"
+
+# regex to replace all hidden paths in a single pass. The working directory is
+# tried first, so it wins when the path to python is inside it
+HIDDEN_PATHS_REGEX = re.compile("|".join(map(re.escape, HIDDEN_PATHS)))
+
+# units of time with their length in seconds, from the largest to the smallest
+TIME_UNITS = (
+    (1.0, "s"),
+    (1e-03, "ms"),
+    (1e-06, "\u03bcs"),
+    (1e-09, "ns"),
+    (1e-12, "ps"),
+    (1e-15, "fs"),
+    (1e-18, "as"),
+    (1e-21, "zs"),
+    (1e-24, "ys"),
+)
+
+# units of time used to format long durations, with their length in seconds
+LONG_TIME_UNITS = (
+    ("weeks", 604800),
+    ("days", 86400),
+    ("hours", 3600),
+    ("minutes", 60),
+    ("seconds", 1),
+)
+
+# translation table to delete the non-digit characters of a mention
+FILTER_ID_TABLE = str.maketrans("", "", "<>@&#! ")
+
 
 def clamp(value, min_, max_):
     """
     Returns the value clamped between a maximum and a minumum
     """
-    value = value if value > min_ else min_
-    return value if value < max_ else max_
+    return min_ if value < min_ else max_ if value > max_ else value
 
 
 def color_to_rgb_int(col: pygame.Color, alpha: bool = False):
     """
     Get integer RGB representation of pygame color object.
     """
-    return (
-        col.r << 32 | col.g << 16 | col.b << 8 | col.a
-        if alpha
-        else col.r << 16 | col.g << 8 | col.b
-    )
+    r, g, b, a = col
+    return r << 32 | g << 16 | b << 8 | a if alpha else r << 16 | g << 8 | b
 
 
 def discordify(text: str):
@@ -49,20 +86,20 @@ def discordify(text: str):
     return discord.utils.escape_markdown(text)
 
 
-def format_discord_link(link: str, guild_id: int):
+@functools.lru_cache(maxsize=8)
+def get_channel_link_prefix(guild_id: int):
     """
-    Format a discord link to a channel or message
+    Get the prefix of discord links to channels or messages of a guild
     """
-    link = link.lstrip("<").rstrip(">").rstrip("/")
+    return f"discord.com/channels/{guild_id}/"
 
-    for prefix in (
-        f"https://discord.com/channels/{guild_id}/",
-        f"https://www.discord.com/channels/{guild_id}/",
-    ):
-        if link.startswith(prefix):
-            link = link[len(prefix) :]
 
-    return link
+def format_discord_link(link: str, guild_id: int):
+    """
+    Format a discord link to a channel or message
+    """
+    link = link.strip("<>/").removeprefix("https://").removeprefix("www.")
+    return link.removeprefix(get_channel_link_prefix(guild_id))
 
 
 def progress_bar(
@@ -71,26 +108,15 @@ def progress_bar(
     """
     A simple horizontal progress bar generator.
     """
-    pct = 0 if pct < 0 else 1 if pct > 1 else pct
-    return full_bar * (int(divisions * pct)) + empty_bar * (
-        divisions - int(divisions * pct)
-    )
+    # clamp inline, this is called for every progress update of long commands
+    filled = int(divisions * (0 if pct < 0 else 1 if pct > 1 else pct))
+    return full_bar * filled + empty_bar * (divisions - filled)
 
 
 def format_time(
     seconds: float,
     decimal_places: int = 4,
-    unit_data: tuple[tuple[float, str], ...] = (
-        (1.0, "s"),
-        (1e-03, "ms"),
-        (1e-06, "\u03bcs"),
-        (1e-09, "ns"),
-        (1e-12, "ps"),
-        (1e-15, "fs"),
-        (1e-18, "as"),
-        (1e-21, "zs"),
-        (1e-24, "ys"),
-    ),
+    unit_data: tuple[tuple[float, str], ...] = TIME_UNITS,
 ):
     """
     Formats time with a prefix
@@ -102,14 +128,7 @@ def format_time(
 
 
 def format_long_time(
-    seconds: int,
-    unit_data: tuple[tuple[str, int], ...] = (
-        ("weeks", 604800),
-        ("days", 86400),
-        ("hours", 3600),
-        ("minutes", 60),
-        ("seconds", 1),
-    ),
+    seconds: int, unit_data: tuple[tuple[str, int], ...] = LONG_TIME_UNITS
 ):
     """
     Formats time into string, which is of the order of a few days
@@ -117,9 +136,9 @@ def format_long_time(
     result: list[str] = []
 
     for name, count in unit_data:
-        value = seconds // count
+        value, remainder = divmod(seconds, count)
         if value or (not result and count == 1):
-            seconds -= value * count
+            seconds = remainder
             if value == 1:
                 name = name[:-1]
             result.append(f"{value} {name}")
@@ -155,23 +174,38 @@ def split_long_message(message: str, limit: int = 2000):
     """
     Splits message string by 2000 characters with safe newline splitting
     """
-    split_output: list[str] = []
-    lines = message.split("\n")
-    temp = ""
+    if len(message) <= limit:
+        # most messages fit, don't split them into lines just to join them again
+        return [message]
 
-    for line in lines:
-        if len(temp) + len(line) + 1 > limit:
-            split_output.append(temp[:-1])
-            temp = line + "\n"
+    split_output: list[str] = []
+    lines: list[str] = []
+    length = 0
+
+    for line in message.split("\n"):
+        # the line, with the newline character that joins it to the next one
+        line_length = len(line) + 1
+        if lines and length + line_length > limit:
+            split_output.append("\n".join(lines))
+            lines = [line]
+            length = line_length
         else:
-            temp += line + "\n"
+            lines.append(line)
+            length += line_length
 
-    if temp:
-        split_output.append(temp)
+    if lines:
+        split_output.append("\n".join(lines))
 
     return split_output
 
 
+def hide_paths(string: str):
+    """
+    Replace the paths in HIDDEN_PATHS in a string, like console output
+    """
+    return HIDDEN_PATHS_REGEX.sub(lambda match: HIDDEN_PATHS[match[0]], string)
+
+
 def format_code_exception(e, pops: int = 1):
     """
     Provide a formatted exception for code snippets
@@ -182,12 +216,7 @@ def format_code_exception(e, pops: int = 1):
     for _ in range(pops):
         tbs.pop(1)
 
-    ret = "".join(tbs).replace(os.getcwd(), "PgBot")
-    if platform.system() == "Windows":
-        # Hide path to python on windows
-        ret = ret.replace(os.path.dirname(sys.executable), "Python")
-
-    return ret
+    return hide_paths("".join(tbs))
 
 
 def filter_id(mention: str):
@@ -196,10 +225,11 @@ def filter_id(mention: str):
     Note that this function can error with ValueError on the int call, so the
     caller of this function must take care of that.
     """
-    for char in ("<", ">", "@", "&", "#", "!", " "):
-        mention = mention.replace(char, "")
+    if mention.isdecimal():
+        # got a plain ID, there is nothing to filter out
+        return int(mention)
 
-    return int(mention)
+    return int(mention.translate(FILTER_ID_TABLE))
 
 
 def filter_emoji_id(name: str):
@@ -216,12 +246,10 @@ def filter_emoji_id(name: str):
         str|int: The emoji id or the input string if it could not convert it to
         an int.
     """
-    if name.count(":") >= 2:
-        emoji_id = name.split(":")[-1][:-1]
-        return int(emoji_id)
-
+    # the ID of a custom emoji comes after its second colon, before the ">"
+    head, _, tail = name.rpartition(":")
     try:
-        return int(name)
+        return int(tail[:-1] if ":" in head else name)
     except ValueError:
         return name
 
@@ -230,7 +258,10 @@ def code_block(string: str, max_characters: int = 2048, code_type: str = ""):
     """
     Formats text into discord code blocks
     """
-    string = string.replace("```", "\u200b`\u200b`\u200b`\u200b")
+    # cut off what can never be displayed before escaping, so that huge strings
+    # (like the repr of a large object) are not escaped entirely. Escaping never
+    # makes the string shorter, so this does not change the output
+    string = string[:max_characters].replace("```", common.ESC_BACKTICK_3X)
     len_ticks = 7 + len(code_type)
 
     if len(string) > max_characters - len_ticks:
@@ -239,22 +270,45 @@ def code_block(string: str, max_characters: int = 2048, code_type: str = ""):
         return f"```{code_type}\n{string}```"
 
 
+@functools.lru_cache(maxsize=None)
+def get_permissions_getter(permissions: tuple[str, ...]):
+    """
+    Get a function that returns a tuple of the given permissions from a
+    discord.Permissions object. The functions are cached for every tuple of
+    permissions
+    """
+    if not permissions:
+        return lambda channel_perms: ()
+
+    getter = operator.attrgetter(*permissions)
+    if len(permissions) == 1:
+        # attrgetter returns the value itself and not a tuple for one attribute
+        return lambda channel_perms: (getter(channel_perms),)
+
+    return getter
+
+
 def check_channel_permissions(
     member: Union[discord.Member, discord.User],
     channel: common.Channel,
     bool_func: Callable[[Iterable], bool] = all,
-    permissions: Iterable[str] = (
-        "view_channel",
-        "send_messages",
-    ),
+    permissions: Optional[Iterable[str]] = None,
+    getter: Optional[Callable[[discord.Permissions], tuple]] = None,
 ) -> bool:
 
     """
     Checks if the given permissions apply to the given member in the given channel.
+    The permissions can also be given as a getter from get_permissions_getter,
+    by default view_channel and send_messages are checked.
     """
 
-    channel_perms = channel.permissions_for(member)
-    return bool_func(getattr(channel_perms, perm_name) for perm_name in permissions)
+    if getter is None:
+        if permissions is None:
+            getter = DEFAULT_PERMISSIONS_GETTER
+        else:
+            getter = get_permissions_getter(tuple(permissions))
+
+    return bool_func(getter(channel.permissions_for(member)))
 
 
 def check_channels_permissions(
@@ -273,22 +327,14 @@ def check_channels_permissions(
     """
 
     if skip_invalid_channels:
-        booleans = tuple(
-            bool_func(getattr(channel_perms, perm_name) for perm_name in permissions)
-            for channel_perms in (
-                channel.permissions_for(member)
-                for channel in channels
-                if isinstance(channel, discord.TextChannel)
-            )
-        )
-    else:
-        booleans = tuple(
-            bool_func(getattr(channel_perms, perm_name) for perm_name in permissions)
-            for channel_perms in (
-                channel.permissions_for(member) for channel in channels
-            )
+        channels = tuple(
+            channel for channel in channels if isinstance(channel, discord.TextChannel)
         )
-    return booleans
+
+    getter = get_permissions_getter(tuple(permissions))
+    return tuple(
+        bool_func(getter(channel.permissions_for(member))) for channel in channels
+    )
 
 
 async def coro_check_channels_permissions(
@@ -306,15 +352,15 @@ async def coro_check_channels_permissions(
     Checks if the given permissions apply to the given member in the given channels.
     """
 
+    getter = get_permissions_getter(tuple(permissions))
     booleans = []
     for i, channel in enumerate(channels):
+        if i and not i % 64:
+            await asyncio.sleep(0)
+
         if skip_invalid_channels and not isinstance(channel, discord.TextChannel):
             continue
 
-        channel_perms = channel.permissions_for(member)
-        booleans.append(bool_func(getattr(channel_perms, perm) for perm in permissions))
-
-        if not i % 5:
-            await asyncio.sleep(0)
+        booleans.append(bool_func(getter(channel.permissions_for(member))))
 
     return booleans